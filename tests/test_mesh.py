@@ -0,0 +1,50 @@
+# coding: utf-8
+"""Tests for the mesh object."""
+
+from __future__ import annotations
+
+import numpy as np
+
+import tetris
+from tetris.mesh import Mesh
+
+
+def unit_cube() -> list[tetris.Vertex]:
+    """Create the vertices of a unit cube."""
+    return [
+        tetris.Vertex(*point)
+        for point in [
+            (0, 0, 0),
+            (1, 0, 0),
+            (1, 1, 0),
+            (0, 1, 0),
+            (0, 0, 1),
+            (1, 0, 1),
+            (1, 1, 1),
+            (0, 1, 1),
+        ]
+    ]
+
+
+def test_transform_about_a_mesh_vertex():
+    vertices = unit_cube()
+    block = tetris.Block.from_vertices(vertices)
+    block.set_edge(
+        tetris.ArcMidEdge(vertices[1], vertices[0], np.array([0.5, -0.1, 0]))
+    )
+
+    mesh = Mesh()
+    mesh.add_block(block)
+    mesh.transform(
+        matrix=tetris.utils.rotation_matrix(yaw=90),
+        translation=[10, 0, 0],
+        origin=vertices[1],
+    )
+
+    # The origin vertex is only translated, and the edge points are rotated
+    # about where the origin was before the transformation.
+    np.testing.assert_allclose(vertices[1].coords, [11, 0, 0], atol=1e-12)
+    np.testing.assert_allclose(vertices[0].coords, [11, -1, 0], atol=1e-12)
+    np.testing.assert_allclose(
+        mesh.edges[0].point, [11.1, -0.5, 0], atol=1e-12
+    )
@@ -4,15 +4,25 @@
 from __future__ import annotations
 
 import copy
+import operator
 from typing import Collection, Union
 
+import numpy as np
+
 import tetris.constants
 import tetris.io
 import tetris.utils
 from tetris.blockmesh.edge import Edge, LineEdge
 from tetris.blockmesh.patch import Patch
 from tetris.blockmesh.vertex import Vertex
-from tetris.typing import BlockMeshElement
+from tetris.typing import BlockMeshElement, NDArray, Vector
+
+
+# Pick the vertices of each face straight from the list of block vertices.
+FACE_GETTERS = {
+    label: operator.itemgetter(*ids)
+    for label, ids in tetris.constants.FACE_MAPPING.items()
+}
 
 
 class Block(BlockMeshElement):
@@ -20,18 +30,19 @@ class Block(BlockMeshElement):
 
     __slots__ = [
         "vertices",
+        "_local_ids",
         "edges",
-        "faces",
         "patches",
-        "__grading",
-        "__grading_type",
-        "ncells",
+        "_grading",
+        "_grading_type",
+        "_ncells",
         "cellZone",
         "description",
     ]
 
     def __init__(self) -> None:
         self.vertices: list[Vertex] = []
+        self._local_ids: dict[int, int] = {}
         self.edges: list[Edge] = []
         self.patches: list[Patch] = []
 
@@ -55,10 +66,38 @@ class Block(BlockMeshElement):
         """Get the block name."""
         return f"b{self.id}"
 
+    @property
+    def coords(self) -> NDArray[np.floating]:
+        """Get the coordinates of the block vertices.
+
+        The result is an (8, 3) array, with one row per vertex, ordered as
+        the block vertices.
+        """
+        return np.array([vertex.coords for vertex in self.vertices])
+
+    @property
+    def ncells(self) -> tuple[int, int, int]:
+        """Get the number of cells on each axis."""
+        return self._ncells
+
+    @ncells.setter
+    def ncells(self, value: Collection[int]) -> None:
+        # Store the number of cells as plain integers, which are written as
+        # they are, without any array conversion.
+        ncells = tuple([int(n) for n in value])
+
+        if len(ncells) != 3:
+            raise ValueError(
+                "The number of cells must be given for each one of the three"
+                " axes."
+            )
+
+        self._ncells = ncells
+
     @property
     def grading(self):
         """Get the block grading on each axis/edge."""
-        return self.__grading
+        return self._grading
 
     @grading.setter
     def grading(self, value: list) -> None:
@@ -69,28 +108,33 @@ class Block(BlockMeshElement):
                 "a list or a tuple."
             )
 
-        # If value has three elements, then we adopt the simpleGrading approach
-        if len(value) == 3:
-            # Copy value so grading levels may be changed freely later.
-            self.__grading = copy.deepcopy(value)
-            self.__grading_type = "simple"
-            return
-
-        # Otherwise, the block uses the 'edgeGrading' approach, which requires
-        # a grading level for each one of the edges. Thus, the grading array
-        # must be of size 12.
-        if len(value) == 12:
-            # We copy the value linked grading levels may be changed freely
-            self.__grading = copy.deepcopy(value)
-            self.__grading_type = "edge"
-            return
-
-        # If we reach here, the number of elements passed are wrong. So, let's
-        # throw an error
-        raise ValueError(
-            "The number of elements defining the grading must be"
-            "either 3 (simpleGrading) or 12 (edgeGrading)"
-        )
+        # The number of elements sets the grading approach: either
+        # simpleGrading (one grading level per axis) or edgeGrading (one
+        # grading level per edge).
+        grading_type = tetris.constants.GRADING_TYPES.get(len(value))
+
+        # If there is no match, the number of elements passed are wrong. So,
+        # let's throw an error
+        if grading_type is None:
+            raise ValueError(
+                "The number of elements defining the grading must be"
+                "either 3 (simpleGrading) or 12 (edgeGrading)"
+            )
+
+        # Copy value so grading levels may be changed freely later.
+        self._grading = self._copy_grading(value)
+        self._grading_type = grading_type
+
+    @staticmethod
+    def _copy_grading(value: Union[list, tuple]) -> Union[list, tuple]:
+        """Copy the grading levels of a block."""
+        # Numbers are immutable, so a shallow copy is enough for plain grading
+        # levels. Only multi-grading levels (nested sequences) need a deep
+        # copy.
+        if all(type(level) in (int, float) for level in value):
+            return list(value)
+
+        return copy.deepcopy(value)
 
     def set_vertices(self, vertices: Collection[Vertex]) -> None:
         """Create a block from a list of vertices."""
@@ -99,27 +143,39 @@ class Block(BlockMeshElement):
             raise ValueError("Incorrect number of vertices. Expected 8")
 
         # Set the list of vertices.
-        self.vertices = [vertex for vertex in vertices]
+        self.vertices = list(vertices)
+
+        # Map each vertex instance to its position in the block, so that
+        # vertices (and thus edges) are found without scanning the list. A
+        # vertex repeated in a collapsed block maps to its first position.
+        self._local_ids = {}
+        for index, vertex in enumerate(self.vertices):
+            self._local_ids.setdefault(id(vertex), index)
+
+        # Check all twelve edges for zero length at once, so that the edges
+        # need not check themselves one by one.
+        ends = self.coords[tetris.constants.EDGE_IDS]
+        if (ends[:, 0] == ends[:, 1]).all(axis=1).any():
+            raise ValueError(
+                "Zero-length edge. Vertices are at the same point in space."
+            )
 
         # Set the edges as straight lines.
         self.edges = [
-            LineEdge(self.vertices[v0], self.vertices[v1])
+            LineEdge._from_vertices(self.vertices[v0], self.vertices[v1])
             for v0, v1 in tetris.constants.BLOCK_EDGES
         ]
 
     def set_edge(self, edge: Edge) -> None:
         """Define a new edge."""
-        ids = (
-            self.vertices.index(edge.v0),
-            self.vertices.index(edge.v1),
-        )
-        ordered_ids = tuple({*ids})
+        ids = (self.local_id(edge.v0), self.local_id(edge.v1))
+        ordered_ids = ids if ids[0] < ids[1] else (ids[1], ids[0])
 
         # Are the vertices in the right order?
         # (i.e., following the OpenFOAM convention)
         right_order = ids == ordered_ids
 
-        self.edges[tetris.constants.BLOCK_EDGES.index(ordered_ids)] = (
+        self.edges[tetris.constants.BLOCK_EDGES_INDEX[ordered_ids]] = (
             edge if right_order else edge.invert()
         )
 
@@ -137,9 +193,9 @@ class Block(BlockMeshElement):
             A tuple of vertex ids that describe the given face label. The
             list is ordered to yield an outward-pointing face.
         """
-        return tuple(
-            [self.vertices[id] for id in tetris.constants.FACE_MAPPING[label]]
-        )
+        # Read the current vertices on every call, as the list is public and
+        # may be changed after the block is created.
+        return FACE_GETTERS[label](self.vertices)
 
     def edge(self, v0: Union[Vertex, int], v1: Union[Vertex, int]) -> Edge:
         """Get the edge defined by vertices v0 and v1.
@@ -156,13 +212,56 @@ class Block(BlockMeshElement):
         Edge
             The edge defined by the two vertices.
         """
-        id0 = v0 if isinstance(v0, int) else self.vertices.index(v0)
-        id1 = v1 if isinstance(v1, int) else self.vertices.index(v1)
-        ids = tuple({id0, id1})
+        id0 = self.local_id(v0)
+        id1 = self.local_id(v1)
+        ids = (id0, id1) if id0 < id1 else (id1, id0)
 
-        edge = self.edges[tetris.constants.BLOCK_EDGES.index(ids)]
+        edge = self.edges[tetris.constants.BLOCK_EDGES_INDEX[ids]]
 
-        return edge if edge.v0 == v0 else edge.invert()
+        return edge if edge.v0 is self.vertices[id0] else edge.invert()
+
+    def local_id(self, vertex: Union[Vertex, int]) -> int:
+        """Get the local id of a block vertex.
+
+        Parameters
+        ----------
+        vertex : Vertex, int
+            Either the vertex instance or the local vertex id.
+
+        Returns
+        -------
+        int
+            The position of the vertex in the block.
+        """
+        if isinstance(vertex, int):
+            return vertex
+
+        # Look for the very same instance first, which avoids comparing the
+        # coordinates of every vertex of the block.
+        index = self._local_ids.get(id(vertex))
+        if index is not None and self.vertices[index] is vertex:
+            return index
+
+        return self.vertices.index(vertex)
+
+    def set_cell_size(self, cell_size: Union[Vector, float]) -> None:
+        """Set the number of cells on each axis from the desired cell size.
+
+        The length of the block on each axis is measured along the straight
+        edges leaving vertex 0, i.e., the edges 0-1 (x1), 0-3 (x2), and 0-4
+        (x3).
+
+        Parameters
+        ----------
+        cell_size : float, vector
+            The desired cell size, either uniform or one per axis.
+        """
+        # Measure the three edges leaving vertex 0 in a single pass.
+        coords = self.coords
+        edges = coords[[1, 3, 4]] - coords[0]
+        lengths = np.sqrt(np.einsum("ij,ij->i", edges, edges))
+
+        self.ncells = np.maximum(np.ceil(lengths / np.asarray(cell_size)), 1)
 
     def write(self) -> str:
         """Write the block in OpenFOAM style.
@@ -172,12 +271,14 @@ class Block(BlockMeshElement):
         str
             OpenFOAM entry for hex blocks.
         """
+        # Vertex names are already strings, so join them as they are.
+        vertices = " ".join([vertex.name for vertex in self.vertices])
+
         return (
-            f"name {self.name} "
-            f"hex ({' '.join([str(v.name) for v in self.vertices])})"
+            f"name {self.name} hex ({vertices})"
             f"{' ' + self.cellZone if self.cellZone else ''}"
             f" {tetris.io.tetris2foam(self.ncells)}"
-            f" {self.__grading_type}Grading"
+            f" {self._grading_type}Grading"
             f" {tetris.io.tetris2foam(self.grading)}"
             f"{tetris.io.comment(self.description)}"
         )
@@ -4,11 +4,12 @@
 from __future__ import annotations
 
 from abc import abstractmethod, abstractproperty
-from typing import Sequence
+from typing import Callable, Sequence
 
 import numpy as np
 
 import tetris.io
+import tetris.utils
 from tetris.blockmesh.geometry import Geometry
 from tetris.blockmesh.vertex import Vertex
 from tetris.typing import BlockMeshElement, NDArray
@@ -17,9 +18,12 @@ from tetris.typing import BlockMeshElement, NDArray
 class Edge(BlockMeshElement):
     """Base class for edge objects."""
 
+    __slots__ = ["v0", "v1"]
+
     def __init__(self, v0: Vertex, v1: Vertex) -> None:
-        # Check whether the vertices are at the same location.
-        if v0 == v1:
+        # Check whether the vertices are at the same location. Comparing
+        # plain lists avoids allocating a boolean array for three values.
+        if v0.coords.tolist() == v1.coords.tolist():
             raise ValueError(
                 "Zero-length edge. Vertices are at the same point in space."
             )
@@ -37,6 +41,17 @@ class Edge(BlockMeshElement):
         """Invert the edge direction."""
         ...
 
+    def map_points(
+        self,
+        function: Callable[[NDArray[np.floating]], NDArray[np.floating]],
+    ) -> None:
+        """Apply a function to the points defining the edge shape.
+
+        The function receives the points as an array and returns their new
+        values. The end vertices are not affected.
+        """
+        pass
+
     def __getitem__(self, index: int) -> Vertex:
         return [self.v0, self.v1][index]
 
@@ -44,15 +59,36 @@ class Edge(BlockMeshElement):
 class LineEdge(Edge):
     """Define a simple straight edge."""
 
+    __slots__ = []
+
     def __init__(self, v0: Vertex, v1: Vertex) -> None:
         super().__init__(v0, v1)
 
+    @classmethod
+    def _from_vertices(cls, v0: Vertex, v1: Vertex) -> LineEdge:
+        """Create a straight edge from vertices known to be apart.
+
+        Skip the zero-length check done in `__init__`, which is unnecessary
+        when the caller has already checked the vertices (e.g., all edges of
+        a block at once).
+        """
+        edge = cls.__new__(cls)
+        edge.v0 = v0
+        edge.v1 = v1
+
+        return edge
+
     @property
     def type(self) -> str:
         return "line"
 
+    @property
+    def length(self) -> float:
+        """Get the edge length."""
+        return float(np.linalg.norm(self.v1.coords - self.v0.coords))
+
     def invert(self) -> LineEdge:
-        return LineEdge(self.v1, self.v0)
+        return LineEdge._from_vertices(self.v1, self.v0)
 
     def write(self) -> str:
         return f"{self.type} {self.v0.name} {self.v1.name}"
@@ -61,6 +97,8 @@ class LineEdge(Edge):
 class ArcEdge(Edge):
     """Base class for arc edges."""
 
+    __slots__ = []
+
     @property
     def type(self) -> str:
         return "arc"
@@ -69,6 +107,8 @@ class ArcEdge(Edge):
 class ArcMidEdge(ArcEdge):
     """Define an arc edge based on a mid point."""
 
+    __slots__ = ["point"]
+
     def __init__(
         self,
         v0: Vertex,
@@ -81,6 +121,12 @@ class ArcMidEdge(ArcEdge):
     def invert(self) -> ArcMidEdge:
         return ArcMidEdge(self.v1, self.v0, self.point)
 
+    def map_points(
+        self,
+        function: Callable[[NDArray[np.floating]], NDArray[np.floating]],
+    ) -> None:
+        self.point = function(np.asarray(self.point, dtype=float))
+
     def write(self) -> str:
         return (
             f"{self.type} {self.v0.name} {self.v1.name} "
@@ -91,6 +137,8 @@ class ArcMidEdge(ArcEdge):
 class ArcOriginEdge(ArcEdge):
     """Define an arc edge based on the circle origin."""
 
+    __slots__ = ["origin", "factor"]
+
     def __init__(
         self,
         v0: Vertex,
@@ -105,6 +153,12 @@ class ArcOriginEdge(ArcEdge):
     def invert(self) -> ArcOriginEdge:
         return ArcOriginEdge(self.v1, self.v0, self.origin, self.factor)
 
+    def map_points(
+        self,
+        function: Callable[[NDArray[np.floating]], NDArray[np.floating]],
+    ) -> None:
+        self.origin = function(np.asarray(self.origin, dtype=float))
+
     def write(self) -> str:
         return (
             f"{self.type} {self.v0.name} {self.v1.name} origin {self.factor} "
@@ -115,25 +169,63 @@ class ArcOriginEdge(ArcEdge):
 class SequenceEdge(Edge):
     """Base class for edges defined by a sequence of points."""
 
+    __slots__ = ["_points", "_points2foam"]
+
     def __init__(
         self, v0: Vertex, v1: Vertex, points: Sequence[NDArray[np.floating]]
     ) -> None:
         super().__init__(v0, v1)
         self.points = points
 
+    @property
+    def points(self) -> NDArray[np.floating]:
+        """Get the points defining the edge."""
+        return self._points
+
+    @points.setter
+    def points(self, value: Sequence[NDArray[np.floating]]) -> None:
+        points = np.array(value, dtype=float)
+
+        if points.size == 0:
+            points = points.reshape(0, 3)
+
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError("The points must be a sequence of 3D points.")
+
+        # The points are kept read-only, so they can only change through this
+        # setter, which also resets their cached OpenFOAM translation.
+        self._points = points
+        self._points.flags.writeable = False
+        self._points2foam: str = ""
+
+        self._update()
+
+    def _update(self) -> None:
+        """Update the values derived from the points, after they change."""
+        pass
+
     def invert(self) -> SequenceEdge:
         return self.__class__(self.v1, self.v0, self.points[::-1])
 
+    def map_points(
+        self,
+        function: Callable[[NDArray[np.floating]], NDArray[np.floating]],
+    ) -> None:
+        self.points = function(self.points)
+
     def write(self) -> str:
-        return (
-            f"{self.type} {self.v0.name} {self.v1.name} "
-            f"{tetris.io.tetris2foam(self.points)}"
-        )
+        # Translating many points is costly, so do it only once.
+        if not self._points2foam:
+            self._points2foam = tetris.io.tetris2foam(self._points)
+
+        return f"{self.type} {self.v0.name} {self.v1.name} {self._points2foam}"
 
 
 class SplineEdge(SequenceEdge):
     """Define a spline edge."""
 
+    __slots__ = []
+
     @property
     def type(self) -> str:
         return "spline"
@@ -142,6 +234,8 @@ class SplineEdge(SequenceEdge):
 class BSplineEdge(SequenceEdge):
     """Define a B-spline edge."""
 
+    __slots__ = []
+
     @property
     def type(self) -> str:
         return "BSpline"
@@ -150,14 +244,43 @@ class BSplineEdge(SequenceEdge):
 class PolyLineEdge(SequenceEdge):
     """Define a poly line edge."""
 
+    __slots__ = ["_inner_length"]
+
     @property
     def type(self) -> str:
         return "polyLine"
 
+    @property
+    def length(self) -> float:
+        """Get the edge length."""
+        if len(self._points) == 0:
+            return tetris.utils.normL2(self.v1.coords - self.v0.coords)
+
+        # The end vertices may move independently of the edge (e.g., when the
+        # mesh is transformed), so only the segments joining them to the
+        # points are measured here.
+        return (
+            tetris.utils.normL2(self._points[0] - self.v0.coords)
+            + self._inner_length
+            + tetris.utils.normL2(self.v1.coords - self._points[-1])
+        )
+
+    def _update(self) -> None:
+        # The points only change through the setter, which calls this method.
+        # So, measure the path between them once here. Fewer than two points
+        # have no inner segment.
+        self._inner_length = (
+            tetris.utils.polyline_length(self._points)
+            if len(self._points) > 1
+            else 0.0
+        )
+
 
 class ProjectEdge(Edge):
     """Define a projected (body-fitted) edge."""
 
+    __slots__ = ["surfaces"]
+
     def __init__(
         self, v0: Vertex, v1: Vertex, surfaces: Sequence[Geometry]
     ) -> None:
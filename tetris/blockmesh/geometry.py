@@ -11,6 +11,8 @@ from tetris.typing import BlockMeshElement
 class Geometry(BlockMeshElement):
     """Base class for geometry objects."""
 
+    __slots__ = ["name"]
+
     def __init__(self, name: str) -> None:
         self.name = name
 
@@ -27,6 +29,8 @@ class Geometry(BlockMeshElement):
 class TriSurfaceMesh(Geometry):
     """Create a geometry based on a surface file."""
 
+    __slots__ = ["file"]
+
     def __init__(self, name: str, file: str) -> None:
         super().__init__(name)
         self.file = file
@@ -5,6 +5,8 @@ from __future__ import annotations
 
 from typing import Sequence
 
+import numpy as np
+
 import tetris.constants
 import tetris.io
 from tetris.blockmesh.geometry import Geometry
@@ -15,6 +17,8 @@ from tetris.typing import BlockMeshElement
 class Face(BlockMeshElement):
     """Define a blockMesh face entry."""
 
+    __slots__ = ["vertices", "geometry"]
+
     def __init__(self, vertices: Sequence[Vertex], geometry: Geometry) -> None:
         self.vertices = vertices
         self.geometry = geometry
@@ -29,14 +33,27 @@ class Face(BlockMeshElement):
 class Patch(BlockMeshElement):
     """Define a blockMesh patch entry."""
 
+    __slots__ = ["name", "faces", "type"]
+
     def __init__(self, name: str, type: str, faces: list) -> None:
+        # Block faces are quadrilaterals. So, each face is written as a row of
+        # four vertex ids.
+        if any(len(face) != 4 for face in faces):
+            raise ValueError(
+                f"Patch {name} has faces that do not have four vertices."
+            )
+
         self.name = name
         self.faces = faces
         self.type = type
 
     def write(self) -> str:
         """Write the patch in OpenFOAM style."""
-        ids = [[f.id for f in face] for face in self.faces]
+        # Gather the vertex ids of all faces into a single array, which is
+        # then translated in one go.
+        ids = np.fromiter(
+            (vertex.id for face in self.faces for vertex in face), dtype=int
+        ).reshape(len(self.faces), 4)
         return f"{self.type} {self.name} {tetris.io.tetris2foam(ids)}"
 
     # Make the class subscriptable
@@ -47,6 +64,8 @@ class Patch(BlockMeshElement):
 class DefaultPatch(BlockMeshElement):
     """Define a blockMesh defaultPatch entry."""
 
+    __slots__ = ["name", "type"]
+
     def __init__(self, name: str, type: str) -> None:
         self.name = name
         self.type = type
@@ -59,6 +78,8 @@ class DefaultPatch(BlockMeshElement):
 class PatchPair(BlockMeshElement):
     """Define a blockMesh mergePatchPair entry."""
 
+    __slots__ = ["master", "slave"]
+
     def __init__(self, master: Patch, slave: Patch) -> None:
         self.master = master
         self.slave = slave
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Union
+from typing import Any, Union
 
 import numpy as np
 
@@ -16,19 +16,61 @@ from tetris.typing import BlockMeshElement, NDArray, Vector, floating
 class Vertex(BlockMeshElement):
     """Define a blockMesh vertex entry."""
 
+    __slots__ = ["_coords"]
+
     def __init__(self, *args: Vector) -> None:
+        # Fast path for the most common declaration: Vertex(x, y, z).
+        if len(args) == 3 and all(type(arg) in (int, float) for arg in args):
+            self._coords = np.array(args, dtype=float)
+            return
+
+        # Fast path for arrays of coordinates: Vertex(array). The array is
+        # copied, so the vertex does not share memory with the caller.
+        if (
+            len(args) == 1
+            and type(args[0]) is np.ndarray
+            and args[0].shape == (3,)
+        ):
+            self._coords = np.array(args[0], dtype=float)
+            return
+
         try:
-            # Append three zeros to args, and then select the first three
-            # elements of the resulting array.
-            self.coords = np.pad(
-                np.asfarray(args).flatten(), np.array([0, 3])
-            )[:3]
+            coords = np.asarray(args, dtype=float).flatten()
         except (TypeError, ValueError):
             raise ValueError(
                 "Invalid arguments. Please, see the docstrings "
                 "for details on how to declare the coordinates."
             )
 
+        # Append three zeros to the coordinates, and then select the first
+        # three elements of the resulting array.
+        self._coords = np.pad(coords, (0, 3))[:3]
+
+    @classmethod
+    def _from_coords(cls, coords: NDArray[floating]) -> Vertex:
+        """Create a vertex from a ready-made coordinate array.
+
+        Skip the argument parsing done in `__init__`, which is unnecessary
+        when `coords` is already a float array with three elements (e.g., the
+        result of an arithmetic operation between vertices).
+        """
+        vertex = cls.__new__(cls)
+        vertex._coords = coords
+
+        return vertex
+
+    @property
+    def coords(self) -> NDArray[floating]:
+        """Get the vertex coordinates."""
+        return self._coords
+
+    @coords.setter
+    def coords(self, value: Vector) -> None:
+        # Once registered to a mesh, the coordinates are a view into the
+        # mesh-wide coordinate array. So, write the new values in place
+        # rather than rebinding the attribute.
+        self._coords[:] = value
+
     @property
     def name(self) -> str:
         """Get the vertex name."""
@@ -125,7 +167,9 @@ class Vertex(BlockMeshElement):
             origin.coords if isinstance(origin, Vertex) else origin
         )
 
-        return Vertex(
+        # The rotated coordinates are a new (3,) float array. So, there is no
+        # need to parse (or copy) them again.
+        return Vertex._from_coords(
             tetris.utils.rotate3D(
                 self.coords, yaw, pitch, roll, origin, degrees
             )
@@ -192,9 +236,11 @@ class Vertex(BlockMeshElement):
 
     def write(self) -> str:
         """Write the coordinates in OpenFOAM style."""
-        v = self.coords
+        # Convert the coordinates to Python floats at once, rather than
+        # indexing the array (and boxing a numpy scalar) for each of them.
+        x, y, z = self.coords.tolist()
 
-        return f"name {self.name} ({v[0]:.6f} {v[1]:.6f} {v[2]:.6f})"
+        return f"name {self.name} ({x:.6f} {y:.6f} {z:.6f})"
 
     def __repr__(self) -> str:
         return f"Vertex{tetris.io.tetris2foam(self.coords)}"
@@ -206,36 +252,57 @@ class Vertex(BlockMeshElement):
     # Let's overload some operators so we can use the Vertex class in a more
     # pythonic way.
     def __neg__(self) -> Vertex:
-        return Vertex(-self.coords)
+        return Vertex._from_coords(-self.coords)
 
     def __eq__(self, other: Union[Vertex, Vector]) -> bool:
-        return all(self.coords == tetris.utils.to_array(other))
+        # Comparing plain lists avoids allocating a boolean array and then
+        # iterating over it in Python.
+        return self.coords.tolist() == tetris.utils.to_array(other).tolist()
 
     def __ne__(self, other: Union[Vertex, Vector]) -> bool:
         return not self.__eq__(other)
 
     # For the next methods (add, sub, mul, and truediv), we adopt a little
     # trick. Instead of using a cascade of if-else statements to check the
-    # argument type, we take advantage of numpy arrays. It is easier on the
-    # eyes to convert to a numpy array and then perform the desired operation.
+    # argument type, we take advantage of numpy broadcasting, which already
+    # handles scalars, lists, tuples, and arrays. Only vertices need to be
+    # unwrapped into their coordinates.
     def __add__(self, other: Union[Vertex, Vector, int, float]) -> Vertex:
-        return Vertex(self.coords + tetris.utils.to_array(other))
+        return Vertex._from_coords(self.coords + _operand(other))
 
     def __sub__(self, other: Union[Vertex, Vector, int, float]) -> Vertex:
-        return Vertex(self.coords - tetris.utils.to_array(other))
+        return Vertex._from_coords(self.coords - _operand(other))
 
     def __mul__(self, other: Union[Vertex, Vector, int, float]) -> Vertex:
-        return Vertex(self.coords * tetris.utils.to_array(other))
+        return Vertex._from_coords(self.coords * _operand(other))
 
     def __truediv__(self, other: Union[Vertex, Vector, int, float]) -> Vertex:
-        return Vertex(self.coords / tetris.utils.to_array(other))
+        return Vertex._from_coords(self.coords / _operand(other))
+
+    # Use the already overloaded operators for the reflected operators.
+    __radd__ = __add__
+    __rsub__ = __sub__
+    __rmul__ = __mul__
+    __rtruediv__ = __truediv__
+
+    # Augmented arithmetic assignments update the coordinates in place rather
+    # than creating a new vertex. Note that the vertex keeps its id, and that
+    # the change is seen by every block sharing it.
+    def __iadd__(self, other: Union[Vertex, Vector, int, float]) -> Vertex:
+        self._coords += _operand(other)
+        return self
+
+    def __isub__(self, other: Union[Vertex, Vector, int, float]) -> Vertex:
+        self._coords -= _operand(other)
+        return self
 
-    # Use the already overloaded operators for both the reflected operators and
-    # augmented arithmetic assignments.
-    __radd__ = __iadd__ = __add__
-    __rsub__ = __isub__ = __sub__
-    __rmul__ = __imul__ = __mul__
-    __rtruediv__ = __itruediv__ = __truediv__
+    def __imul__(self, other: Union[Vertex, Vector, int, float]) -> Vertex:
+        self._coords *= _operand(other)
+        return self
+
+    def __itruediv__(self, other: Union[Vertex, Vector, int, float]) -> Vertex:
+        self._coords /= _operand(other)
+        return self
 
     # Overloading the __eq__ operator leads to a TypeError when trying to hash
     # instances of the Vertex class. Hence, to retain the implementation of
@@ -244,17 +311,24 @@ class Vertex(BlockMeshElement):
     __hash__ = BlockMeshElement.__hash__  # type: ignore
 
 
+def _operand(other: Union[Vertex, Vector, int, float]) -> Any:
+    """Get the value taking part in an arithmetic operation with a vertex."""
+    return other.coords if isinstance(other, Vertex) else other
+
+
 class ProjectVertex(Vertex):
     """Define a projected vertex onto a surface."""
 
+    __slots__ = ["geometries"]
+
     def __init__(self, coords: Vector, geometries: list[Geometry]) -> None:
         super().__init__(coords)
         self.geometries = geometries
 
     def write(self) -> str:
-        v = self.coords
+        x, y, z = self.coords.tolist()
 
         return (
-            f"name {self.name} project ({v[0]:.6f} {v[1]:.6f} {v[2]:.6f})"
+            f"name {self.name} project ({x:.6f} {y:.6f} {z:.6f})"
             f" {tetris.io.tetris2foam([x.name for x in self.geometries])}"
         )
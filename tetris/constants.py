@@ -3,6 +3,8 @@
 
 from collections import OrderedDict
 
+import numpy as np
+
 # Sequence of vertices that yield an outward-pointing face
 # Check https://cfd.direct/openfoam/user-guide/blockMesh/#x26-1850174 for
 # more information on how vertices are labeled.
@@ -49,3 +51,15 @@ BLOCK_EDGES = (
     (2, 6),
     (3, 7),
 )
+
+# Position of each edge in BLOCK_EDGES, for constant-time lookups.
+BLOCK_EDGES_INDEX = {edge: index for index, edge in enumerate(BLOCK_EDGES)}
+
+# Same as BLOCK_EDGES, but as an index array for gathering the end points of
+# all edges at once (e.g., coords[EDGE_IDS]).
+EDGE_IDS = np.array(BLOCK_EDGES, dtype=np.intp)
+EDGE_IDS.flags.writeable = False
+
+# Grading approach of a block, given the number of grading levels: one per
+# axis (simpleGrading) or one per edge (edgeGrading).
+GRADING_TYPES = {3: "simple", 12: "edge"}
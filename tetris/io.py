@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Sequence, Union
+from typing import Any, Callable, Sequence, Union
 
 from numpy import ndarray
 
@@ -12,16 +12,16 @@ from tetris.typing import BlockMeshElement
 
 def comment(string: Any) -> str:
     """Output `string` as a comment in OpenFOAM C++ style."""
-    if string not in [None, ""]:
-        return f" // {string}"
-    return ""
+    if string is None or string == "":
+        return ""
+    return f" // {string}"
 
 
 def printif(string: str, pre_sep: str = " ", post_sep: str = " ") -> str:
     """Print `string` if `string` is not null."""
-    if string not in [None, ""]:
-        return f"{pre_sep}{string}{post_sep}"
-    return ""
+    if string is None or string == "":
+        return ""
+    return f"{pre_sep}{string}{post_sep}"
 
 
 def str2foam(value: str) -> str:
@@ -50,15 +50,38 @@ def float2foam(value: float, show_sign: bool = False) -> str:
     return number2foam(value, show_sign, precision=".6", type="f")
 
 
+# printf-style formats equivalent to `str2foam`, `int2foam`, and `float2foam`,
+# used for formatting homogeneous sequences of scalars at once.
+SCALAR_FORMATS = {str: "%s", int: "%d", float: "%.6f"}
+NUMPY_FORMATS = {"i": "%d", "u": "%d", "f": "%.6f"}
+
+
 def sequence2foam(value: Sequence[Any], sep: str = " ") -> str:
     """Translate Python list to OpenFOAM style."""
+    # Sequences holding a single scalar type (e.g., a list of floats or of
+    # vertex names) are formatted with a single string operation.
+    if len(types := set(map(type, value))) == 1:
+        if (fmt := SCALAR_FORMATS.get(types.pop())) is not None:
+            return "(" + sep.join([fmt] * len(value)) % tuple(value) + ")"
+
     r = sep.join([tetris2foam(v) for v in value])
     return f"({r})"
 
 
 def numpy2foam(value: ndarray, sep: str = " ") -> str:
     """Translate Numpy array to OpenFOAM style."""
-    return sequence2foam(value.tolist(), sep)
+    fmt = NUMPY_FORMATS.get(value.dtype.kind)
+
+    if fmt is None or value.ndim not in (1, 2):
+        return sequence2foam(value.tolist(), sep)
+
+    # Build the format string of the whole array, and then format all values
+    # at once instead of translating them one by one.
+    fmt = "(" + sep.join([fmt] * value.shape[-1]) + ")"
+    if value.ndim == 2:
+        fmt = "(" + sep.join([fmt] * value.shape[0]) + ")"
+
+    return fmt % tuple(value.ravel().tolist())
 
 
 def blockMeshElement2foam(value: BlockMeshElement) -> str:
@@ -66,20 +89,42 @@ def blockMeshElement2foam(value: BlockMeshElement) -> str:
     return value.write()
 
 
-def tetris2foam(element: Any) -> str:
-    """Translate Tetris objects into OpenFOAM style."""
+# Map each supported type to its translation function. Defined once at module
+# level rather than on every call to `tetris2foam`.
+TRANSLATE_TYPES = {
+    str: str2foam,
+    int: int2foam,
+    float: float2foam,
+    list: sequence2foam,
+    tuple: sequence2foam,
+    ndarray: numpy2foam,
+    BlockMeshElement: blockMeshElement2foam,
+}
 
-    translate_types = {
-        str: str2foam,
-        int: int2foam,
-        float: float2foam,
-        list: sequence2foam,
-        tuple: sequence2foam,
-        ndarray: numpy2foam,
-        BlockMeshElement: blockMeshElement2foam,
-    }
+# Translation functions found for subclasses of the types above (e.g., the
+# vertex or block classes). Kept apart so that the table above stays as is.
+_TRANSLATE_CACHE: dict[type, Callable[[Any], str]] = {}
 
-    if (element_type := type(element)) in translate_types:
-        return translate_types[element_type](element)
 
-    raise TypeError(f"Could not print {element} of type {element_type}")
+def tetris2foam(element: Any) -> str:
+    """Translate Tetris objects into OpenFOAM style."""
+    # Look up the exact type first, which is the common case.
+    element_type = type(element)
+    translate = TRANSLATE_TYPES.get(element_type) or _TRANSLATE_CACHE.get(
+        element_type
+    )
+    if translate is not None:
+        return translate(element)
+
+    # Otherwise, look for a parent type (e.g., any subclass of
+    # BlockMeshElement), and remember the match so that further elements of
+    # the same type are found by the lookup above.
+    for parent_type, translate in TRANSLATE_TYPES.items():
+        if isinstance(element, parent_type):
+            break
+    else:
+        raise TypeError(f"Could not print {element} of type {element_type}")
+
+    _TRANSLATE_CACHE[element_type] = translate
+
+    return translate(element)
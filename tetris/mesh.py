@@ -3,49 +3,84 @@
 
 from __future__ import annotations
 
+import functools
 import pathlib
+import sys
+from typing import Union
 
+import numpy as np
 from jinja2 import Template
+from jinja2.environment import TemplateStream
 
+import tetris.utils
 from tetris.blockmesh.block import Block
 from tetris.blockmesh.edge import Edge
 from tetris.blockmesh.geometry import Geometry
 from tetris.blockmesh.patch import Face, Patch, PatchPair
 from tetris.blockmesh.vertex import Vertex
 from tetris.template import BLOCKMESHDICT_TEMPLATE
+from tetris.typing import DTypeLike, NDArray, Vector
+
+
+@functools.lru_cache(maxsize=4)
+def compile_template(source: str) -> Template:
+    """Compile a Jinja2 template, reusing the result for repeated sources."""
+    return Template(source)
+
+
+# Compile the default template once, when the module is first imported.
+compile_template(BLOCKMESHDICT_TEMPLATE)
 
 
 class Mesh:
     """Provide a mesh object interface that outputs a blockMeshDict."""
 
     __slots__ = [
-        "ids",
         "scale",
         "geometries",
         "vertices",
+        "_xyz",
+        "_special_vertices",
         "blocks",
         "edges",
+        "_edge_index",
         "faces",
         "patches",
         "merge_patch_pairs",
     ]
 
-    def __init__(self) -> None:
-        self.ids: dict[str, int] = {
-            "vertex": 0,
-            "block": 0,
-            "patch": 0,
-            "edge": 0,
-        }
+    def __init__(self, dtype: DTypeLike = np.float64) -> None:
+        """Create an empty mesh.
+
+        Parameters
+        ----------
+        dtype: data-type
+            The floating-point type used for storing the vertex coordinates.
+            Vertices are written with six decimal places, which single
+            precision (np.float32) only resolves for coordinates below about
+            ten in magnitude. So, double precision is the default.
+        """
         self.scale: int = 1
         self.geometries: list[Geometry] = []
         self.vertices: list[Vertex] = []
+        self._xyz: NDArray[np.floating] = np.empty((0, 3), dtype=dtype)
+        self._special_vertices: list[Vertex] = []
         self.blocks: list[Block] = []
         self.edges: list[Edge] = []
+        self._edge_index: dict[frozenset[int], Edge] = {}
         self.faces: list[Face] = []
         self.patches: list[Patch] = []
         self.merge_patch_pairs: list[PatchPair] = []
 
+    @property
+    def coords(self) -> NDArray[np.floating]:
+        """Get the coordinates of all registered vertices.
+
+        The result is an (N, 3) view, with one row per vertex, ordered by the
+        vertex id. Changing its values moves the vertices.
+        """
+        return self._xyz[: len(self.vertices)]
+
     def add_geometry(self, geometry: Geometry) -> None:
         """Register a new geometry to the mesh."""
         if not isinstance(geometry, Geometry):
@@ -66,47 +101,71 @@ class Mesh:
             self.add_edge(edge)
 
         if block.id < 0:
+            block.id = len(self.blocks)
             self.blocks.append(block)
-            self.blocks[-1].id = self.ids["block"]
-            self.ids["block"] += 1
 
     def add_edge(self, edge: Edge) -> None:
         """Register a new edge to the mesh."""
-        # If the edge type is undefined, we have a simple straight line. No
-        # need for registering it to the mesh.
-        if edge.type is None:
-            return
-
         # Register the vertices defining the extremities if not already
         # registered
         for vertex in [edge.v0, edge.v1]:
             self.add_vertex(vertex)
 
-        # TODO:
-        #   For now, no check is done to verify whether the inverse edge is
-        #   already defined. It makes no sense to have two edges defining the
-        #   same curve -- or even worse, defining different curves --, which
-        #   would crash blockMesh. So, future versions could (should?) perform
-        #   some kind of verification.
+        # Straight lines are the blockMesh default, so they are not written to
+        # the blockMeshDict. Also, it makes no sense to have two edges
+        # defining the same curve -- or even worse, defining different curves
+        # --, which would crash blockMesh. So, only the first edge connecting
+        # a given pair of vertices, in either direction, is registered.
+        key = frozenset((edge.v0.id, edge.v1.id))
+        if edge.type == "line" or key in self._edge_index:
+            return
+
         if edge.id < 0:
+            edge.id = len(self.edges)
             self.edges.append(edge)
-            self.edges[-1].id = self.ids["edge"]
-            self.ids["edge"] += 1
-            return
+            self._edge_index[key] = edge
 
     def add_vertex(self, vertex: Vertex) -> None:
         """Register a new vertex to the mesh."""
         if vertex.id < 0:
+            # The element lists are append-only. So, the number of registered
+            # elements is the id of the next one.
+            row = vertex.id = len(self.vertices)
+
+            # Store the coordinates of all vertices in a single (N, 3) array,
+            # and make each vertex a view into its own row. This way, the
+            # whole set of vertices can be handled at once with numpy.
+            if row == len(self._xyz):
+                self._grow_coordinates()
+
+            self._xyz[row] = vertex.coords
+            vertex._coords = self._xyz[row]
+
             self.vertices.append(vertex)
-            self.vertices[-1].id = self.ids["vertex"]
-            self.ids["vertex"] += 1
+
+            # Keep track of the vertices that write more than coordinates
+            # (e.g., projected vertices).
+            if type(vertex) is not Vertex:
+                self._special_vertices.append(vertex)
+
+    def _grow_coordinates(self) -> None:
+        """Double the capacity of the vertex coordinate array."""
+        nvertices = len(self.vertices)
+
+        xyz = np.empty((max(2 * len(self._xyz), 8), 3), dtype=self._xyz.dtype)
+        xyz[:nvertices] = self._xyz[:nvertices]
+
+        # Rebind the registered vertices to the new array.
+        for row, vertex in enumerate(self.vertices):
+            vertex._coords = xyz[row]
+
+        self._xyz = xyz
 
     def add_patch(self, patch: Patch) -> None:
         """Register a new patch to the mesh."""
         if patch.id < 0:
+            patch.id = len(self.patches)
             self.patches.append(patch)
-            self.patches[-1].id = self.ids["patch"]
-            self.ids["patch"] += 1
 
     def add_mergePatchPairs(self, master: Patch, slave: Patch) -> None:
         """Merge the slave patch into the master patch."""
@@ -125,6 +184,92 @@ class Mesh:
 
         self.faces.append(face)
 
+    def transform(
+        self,
+        matrix: NDArray[np.floating] = np.eye(3),
+        translation: Union[Vertex, Vector, int, float] = 0,
+        scale: Union[Vector, int, float] = 1,
+        origin: Union[Vertex, Vector] = np.zeros(3),
+    ) -> None:
+        """Transform all registered vertices and edges at once.
+
+        Each point p is mapped to scale * (matrix @ (p - origin)) + origin +
+        translation. Geometries (e.g., surface files) are not transformed.
+
+        Parameters
+        ----------
+        matrix: np.ndarray
+            A 3x3 linear transformation (e.g., a rotation matrix).
+        translation: int, float, Vertex, vector
+            The translation vector.
+        scale: int, float, vector
+            The scaling factor, either uniform or one per axis.
+        origin: Vertex, vector
+            The point about which rotation and scaling are done.
+        """
+        # Fold the scaling into the matrix and the translation into the
+        # offset, so that every point is transformed by a single matmul and a
+        # single addition.
+        affine = tetris.utils.to_array(scale)[:, None] * matrix
+        # A registered vertex is a view into the coordinate array, which is
+        # overwritten below. So, copy the origin before moving anything.
+        origin = np.array(tetris.utils.to_array(origin), dtype=float)
+        offset = origin + tetris.utils.to_array(translation)
+
+        def transform(points: NDArray[np.floating]) -> NDArray[np.floating]:
+            return (points - origin) @ affine.T + offset
+
+        # The registered vertices are views into the coordinate array. So,
+        # transforming the array transforms all of them at once.
+        self.coords[:] = transform(self.coords)
+
+        for edge in self.edges:
+            edge.map_points(transform)
+
+    def translate(self, vector: Union[Vertex, Vector, int, float]) -> None:
+        """Translate all registered vertices and edges.
+
+        Parameters
+        ----------
+        vector: int, float, Vertex, vector
+            The translation vector.
+        """
+        self.transform(translation=vector)
+
+    def rotate(
+        self,
+        yaw: float = 0,
+        pitch: float = 0,
+        roll: float = 0,
+        origin: Union[Vertex, Vector] = np.zeros(3),
+        degrees: bool = True,
+    ) -> None:
+        """Rotate all registered vertices and edges around a reference point.
+
+        Geometries (e.g., surface files) are not rotated.
+
+        Parameters
+        ----------
+        yaw: float
+            Rotation angle about the z axis.
+        pitch: float
+            Rotation angle about the y axis.
+        roll: float
+            Rotation angle about the x axis.
+        origin: Vertex, vector
+            The point about which rotation is done.
+        degrees: bool
+            Interpret angles as in degrees rather than radians.
+        """
+        # Without any rotation, there is nothing to transform.
+        if yaw == 0 and pitch == 0 and roll == 0:
+            return
+
+        self.transform(
+            tetris.utils.rotation_matrix(yaw, pitch, roll, degrees),
+            origin=origin,
+        )
+
     def reset(self) -> None:
         """Reset the current instance and element ids."""
         for attribute in (
@@ -139,7 +284,11 @@ class Mesh:
             for element in self.__getattribute__(attribute):
                 element.id = -1
 
-        self.__init__()
+        # Detach the vertices from the coordinate array.
+        for vertex in self.vertices:
+            vertex._coords = vertex.coords.copy()
+
+        self.__init__(self._xyz.dtype)
 
     def write(
         self,
@@ -149,9 +298,11 @@ class Mesh:
         footer: str = "",
     ) -> None:
         """Write the rendered blockMeshDict to file."""
+        # Stream the rendered template straight into the file, so the whole
+        # blockMeshDict never needs to be held in memory at once.
         with open(pathlib.Path(filename).resolve(), "w+") as file:
-            file.write(
-                self._render(template=template, header=header, footer=footer)
+            self._stream(template=template, header=header, footer=footer).dump(
+                file
             )
 
     def print(
@@ -161,21 +312,47 @@ class Mesh:
         footer: str = "",
     ) -> None:
         """Print the rendered blockMeshDict to screen."""
-        print(self._render(template=template, header=header, footer=footer))
+        self._stream(template=template, header=header, footer=footer).dump(
+            sys.stdout
+        )
+        sys.stdout.write("\n")
 
-    def _render(
-        self, template: str, header: str = "", footer: str = ""
-    ) -> str:
-        """Render a blockMeshDict template using Jinja2."""
+    def _format_vertices(self) -> str:
+        """Format the entries of all registered vertices at once."""
+        nvertices = len(self.vertices)
+
+        # Format the whole coordinate array with a single string operation
+        # instead of calling Vertex.write for each vertex.
+        values = tuple(
+            np.column_stack((np.arange(nvertices), self.coords))
+            .ravel()
+            .tolist()
+        )
+        entry = "name v%d (%.6f %.6f %.6f)"
+
+        if not self._special_vertices:
+            return "\n    ".join([entry] * nvertices) % values
+
+        # Special vertices write extra information. So, let them write
+        # themselves.
+        entries = (f"{entry}\n" * nvertices % values).splitlines()
+        for vertex in self._special_vertices:
+            entries[vertex.id] = vertex.write()
+
+        return "\n    ".join(entries)
+
+    def _context(self, header: str = "", footer: str = "") -> dict:
+        """Collect the variables used for rendering a blockMeshDict."""
         from tetris import __version__ as TETRIS_VERSION
 
-        render = Template(template).render(
+        return dict(
             header=header,
             footer=footer,
             version=TETRIS_VERSION,
             scale=self.scale,
             geometries=self.geometries,
             vertices=self.vertices,
+            vertices_block=self._format_vertices(),
             blocks=self.blocks,
             edges=[edge for edge in self.edges if edge.type != "line"],
             faces=self.faces,
@@ -183,4 +360,10 @@ class Mesh:
             mergePatchPairs=self.merge_patch_pairs,
         )
 
-        return render
+    def _stream(
+        self, template: str, header: str = "", footer: str = ""
+    ) -> TemplateStream:
+        """Render a blockMeshDict template piece by piece using Jinja2."""
+        return compile_template(template).stream(
+            **self._context(header, footer)
+        )
@@ -25,8 +25,8 @@ geometry
 {% endif -%}
 vertices
 (
-    {%- for v in vertices %}
-    {{ v.write() }}{% endfor %}
+    {%- if vertices_block %}
+    {{ vertices_block }}{% endif %}
 );
 
 blocks
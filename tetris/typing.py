@@ -4,10 +4,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Type, Union
+from typing import Any, List, Tuple, Type, Union
 
 from numpy import floating
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 Vector = Union[List[floating], Tuple[floating], NDArray[floating]]
 
@@ -15,10 +15,16 @@ Vector = Union[List[floating], Tuple[floating], NDArray[floating]]
 class BlockMeshElement(ABC):
     """Base class for blockMesh elements."""
 
-    @classmethod
-    def __init_subclass__(cls: Type[BlockMeshElement]) -> None:
-        """Initiate the subclass with a generic id."""
-        cls.id: int = -1
+    __slots__ = ["id"]
+
+    def __new__(
+        cls: Type[BlockMeshElement], *args: Any, **kwargs: Any
+    ) -> BlockMeshElement:
+        """Initiate the element with a generic id."""
+        element = super().__new__(cls)
+        element.id: int = -1
+
+        return element
 
     @abstractmethod
     def write(self) -> str:
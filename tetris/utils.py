@@ -3,12 +3,15 @@
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING, Union
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.spatial.transform import Rotation
 
+# Imported as a module since it imports this one in turn. The Vertex class is
+# only looked up at call time, after both modules finished loading.
+import tetris.blockmesh.vertex
 from tetris.typing import Vector
 
 if TYPE_CHECKING:
@@ -32,14 +35,15 @@ def normL2(array: NDArray[np.floating]) -> float:
     float
         The norm L2 of a given vector or matrix.
     """
-    return np.linalg.norm(array, axis=-1).reshape(
-        None
-        if array.ndim == 1
-        else (
-            array.shape[0],
-            1,
-        )
-    )
+    # For a single vector, a dot product is the cheapest way of summing the
+    # squared components.
+    if array.ndim == 1:
+        return math.sqrt(array @ array)
+
+    # Otherwise, square and sum the components of each row in a single pass,
+    # skipping the generic machinery of np.linalg.norm. Keep the norms as a
+    # column, so that they broadcast against the rows of the matrix.
+    return np.sqrt(np.einsum("ij,ij->i", array, array))[:, None]
 
 
 def unit_vector(v: NDArray[np.floating]) -> NDArray[np.floating]:
@@ -120,14 +124,27 @@ def unit_normal_vector(
         The unit normal vector to the straight element that is defined by
         elements e1 and e2.
     """
-    from tetris.blockmesh import Vertex
-
     # As the function handles lists, tuples, and numpy.ndarrys as well, it is
     # of interest to convert the arguments to a common element; in this case,
-    # we use tetris.Vertex instances to provide a standardized numpy.ndarray
-    # element.
-    _e1 = Vertex(e1).coords
-    _e2 = Vertex(e2).coords
+    # a three-dimensional numpy.ndarray.
+    _e1 = _as_coords(e1)
+    _e2 = _as_coords(e2)
+
+    # Points on the XY plane (e.g., two-dimensional points) need no numpy
+    # machinery. The z direction is always empty, and the x or y directions
+    # are empty wherever either point has a zero component. The result is the
+    # same as the one from the general case below, only in scalar arithmetic.
+    x1, y1, z1 = _e1.tolist()
+    x2, y2, z2 = _e2.tolist()
+    if z1 == 0 and z2 == 0:
+        sign = 1.0 if inverse else -1.0
+        wx = sign if not (x1 and x2) else 0.0
+        wy = sign if not (y1 and y2) else 0.0
+        dx, dy = x2 - x1, y2 - y1
+
+        return unit_vector(
+            np.array([sign * dy, -sign * dx, dx * wy - dy * wx])
+        )
 
     # Let's evaluate in which plane we are working on
     empty_dims = (~(_e1.astype(bool) & _e2.astype(bool))).astype(int)
@@ -140,7 +157,7 @@ def unit_normal_vector(
 
     # At least one element is two-dimensional. Let's find the vector connecting
     # these two points.
-    vector = _e1 + _e2
+    vector = _e2 - _e1
 
     # See Notes in the docstring for information on how the empty direction is
     # chosen.
@@ -150,6 +167,60 @@ def unit_normal_vector(
     return unit_vector(np.cross(vector, empty_dim))
 
 
+def rotation_matrix(
+    yaw: float = 0,
+    pitch: float = 0,
+    roll: float = 0,
+    degrees: bool = True,
+) -> NDArray[np.floating]:
+    """Compute the rotation matrix for the given yaw, pitch, and roll angles.
+
+    The resulting matrix is the composition Rz(yaw) @ Ry(pitch) @ Rx(roll),
+    i.e., the roll is applied first and the yaw last.
+
+    Parameters
+    ----------
+    yaw: float
+        Rotation angle about the z axis.
+    pitch: float
+        Rotation angle about the y axis.
+    roll: float
+        Rotation angle about the x axis.
+    degrees: bool
+        Interpret angles as in degrees rather than radians.
+
+    Return
+    ------
+    np.ndarray
+        The 3x3 rotation matrix.
+    """
+    if degrees:
+        yaw, pitch, roll = (
+            math.radians(yaw),
+            math.radians(pitch),
+            math.radians(roll),
+        )
+
+    cy, sy = math.cos(yaw), math.sin(yaw)
+    cp, sp = math.cos(pitch), math.sin(pitch)
+    cr, sr = math.cos(roll), math.sin(roll)
+
+    # Fill in the closed-form product Rz @ Ry @ Rx instead of building and
+    # multiplying the three elementary matrices.
+    matrix = np.empty((3, 3))
+    matrix[0, 0] = cy * cp
+    matrix[0, 1] = cy * sp * sr - sy * cr
+    matrix[0, 2] = cy * sp * cr + sy * sr
+    matrix[1, 0] = sy * cp
+    matrix[1, 1] = sy * sp * sr + cy * cr
+    matrix[1, 2] = sy * sp * cr - cy * sr
+    matrix[2, 0] = -sp
+    matrix[2, 1] = cp * sr
+    matrix[2, 2] = cp * cr
+
+    return matrix
+
+
 def rotate3D(
     coords: NDArray[np.floating],
     yaw: float = 0,
@@ -158,12 +229,12 @@ def rotate3D(
     origin: NDArray[np.floating] = np.zeros(3),
     degrees: bool = True,
 ) -> NDArray[np.floating]:
-    """Rotate a 3D point about a reference point.
+    """Rotate one or more 3D points about a reference point.
 
     Parameters
     ----------
     coords: np.ndarray
-        A three-dimensional point in space.
+        A three-dimensional point in space, or an (N, 3) array of points.
     yaw: float
         Rotation angle about the z axis.
     pitch: float
@@ -180,31 +251,127 @@ def rotate3D(
     np.ndarray
         The new coordiantes
     """
-    return (coords - origin) @ Rotation.from_euler(
-        "zyx", np.asarray([-yaw, -pitch, -roll]), degrees=degrees
-    ).as_matrix() + origin
+    # Without any rotation, the points stay where they are. Still, return a
+    # copy, as callers expect new coordinates.
+    if yaw == 0 and pitch == 0 and roll == 0:
+        return np.array(coords, dtype=float)
+
+    # Points are stored as rows, so apply the transposed matrix on the right.
+    # This rotates a whole (N, 3) array of points in a single matmul.
+    matrix = rotation_matrix(yaw, pitch, roll, degrees)
+
+    return (coords - origin) @ matrix.T + origin
 
 
 def distance(
     point1: Union[Vertex, Vector], point2: Union[Vertex, Vector]
-) -> float:
-    """Calculate the distance between two points."""
-    p1: NDArray[np.floating] = (
-        point1.coords if isinstance(point1, Vertex) else np.array(point1)
-    )
-    p2: NDArray[np.floating] = (
-        point2.coords if isinstance(point2, Vertex) else np.array(point2)
+) -> Union[float, NDArray[np.floating]]:
+    """Calculate the distance between two points.
+
+    Either point may also be an (N, 3) array of points, one per row. In this
+    case, the N distances are computed at once and returned as an array.
+    """
+    if _is_batch(point1, point2):
+        d = _as_points(point1) - _as_points(point2)
+        return np.sqrt(np.einsum("ij,ij->i", d, d))
+
+    # For a single pair of points, plain float arithmetic is cheaper than the
+    # overhead of calling into numpy.
+    return math.dist(_as_coords(point1).tolist(), _as_coords(point2).tolist())
+
+
+def is_collinear(
+    v0: Union[Vertex, Vector],
+    v1: Union[Vertex, Vector],
+    v2: Union[Vertex, Vector],
+    tol: float = 0.0,
+) -> Union[bool, NDArray[np.bool_]]:
+    """Determine whether three points are collinear.
+
+    Parameters
+    ----------
+    v0, v1, v2 : Vertex, vector, numpy.ndarray
+        The points to check. Any of them may also be an (N, 3) array of
+        points, one per row, for checking N triplets at once.
+    tol : float
+        Absolute tolerance on the components of the cross product. The
+        default requires the points to be exactly collinear.
+
+    Returns
+    -------
+    bool, numpy.ndarray
+        True if the three points lie on a single straight line. For arrays
+        of points, a boolean array with one element per triplet.
+    """
+    if _is_batch(v0, v1, v2):
+        p0 = _as_points(v0)
+        a, b = np.broadcast_arrays(p0 - _as_points(v1), p0 - _as_points(v2))
+        ax, ay, az = a.T
+        bx, by, bz = b.T
+
+        return (
+            (np.abs(ay * bz - az * by) <= tol)
+            & (np.abs(az * bx - ax * bz) <= tol)
+            & (np.abs(ax * by - ay * bx) <= tol)
+        )
+
+    # Plain two-dimensional points need no conversion: only the z component
+    # of their cross product may be nonzero.
+    if all(not _is_vertex(v) and len(v) == 2 for v in (v0, v1, v2)):
+        (x0, y0), (x1, y1), (x2, y2) = v0, v1, v2
+        return abs((x0 - x1) * (y0 - y2) - (y0 - y1) * (x0 - x2)) <= tol
+
+    x0, y0, z0 = _as_coords(v0).tolist()
+    x1, y1, z1 = _as_coords(v1).tolist()
+    x2, y2, z2 = _as_coords(v2).tolist()
+
+    ax, ay, az = x0 - x1, y0 - y1, z0 - z1
+    bx, by, bz = x0 - x2, y0 - y2, z0 - z2
+
+    # The points are collinear if the cross product a x b is the null vector.
+    # Note that checking the sum of its components is not enough, as they may
+    # cancel each other out.
+    return (
+        abs(ay * bz - az * by) <= tol
+        and abs(az * bx - ax * bz) <= tol
+        and abs(ax * by - ay * bx) <= tol
     )
 
-    return normL2(p1 + p2)
 
+def segment_lengths(points: NDArray[np.floating]) -> NDArray[np.floating]:
+    """Compute the lengths of the segments joining consecutive points.
 
-def is_collinear(v0: Vertex, v1: Vertex, v2: Vertex) -> bool:
-    """Determine whether three points are collinear."""
-    a = (v0 - v1).coords
-    b = (v0 - v2).coords
+    Parameters
+    ----------
+    points : numpy.ndarray
+        An (N, 3) array of points describing a path.
 
-    return np.cross(a, b).sum() == 0
+    Returns
+    -------
+    numpy.ndarray
+        An array with N - 1 elements, one per segment.
+    """
+    segments = points[1:] - points[:-1]
+
+    # Square and sum the components in a single pass, without allocating an
+    # intermediate array of squared components.
+    return np.sqrt(np.einsum("ij,ij->i", segments, segments))
+
+
+def polyline_length(points: NDArray[np.floating]) -> float:
+    """Compute the length of the path through a sequence of points.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        An (N, 3) array of points describing a path.
+
+    Returns
+    -------
+    float
+        The sum of the lengths of the segments joining consecutive points.
+    """
+    return float(segment_lengths(points).sum())
 
 
 def ncells_simple(cell_size: float, edge_length: float) -> int:
@@ -221,16 +388,56 @@ def ncells_simple(cell_size: float, edge_length: float) -> int:
         The number of cells that satisfies the desired cell size for a
         given edge length.
     """
-    return int(np.ceil(edge_length / cell_size))
+    return math.ceil(edge_length / cell_size)
 
 
 def to_array(
     element: Union[Vertex, Vector, int, float]
 ) -> NDArray[np.floating]:
-    from tetris.blockmesh.vertex import Vertex
-
     return (
         element.coords
-        if isinstance(element, Vertex)
+        if _is_vertex(element)
         else np.ones(3) * np.asarray(element)
     )
+
+
+def _is_vertex(element: object) -> bool:
+    """Check whether the element is a vertex.
+
+    Blocks and meshes expose `coords` too, so the type is checked instead.
+    """
+    return isinstance(element, tetris.blockmesh.vertex.Vertex)
+
+
+def _as_coords(element: Union[Vertex, Vector]) -> NDArray[np.floating]:
+    """Get the three coordinates of a point.
+
+    Work like the coordinates of `Vertex(element)`, i.e., missing coordinates
+    are set to zero, but without creating a vertex.
+    """
+    if _is_vertex(element):
+        return element.coords
+
+    values = np.asarray(element, dtype=float).ravel()
+    if values.shape == (3,):
+        return values
+
+    coords = np.zeros(3)
+    coords[: min(len(values), 3)] = values[:3]
+
+    return coords
+
+
+def _is_batch(*points: Union[Vertex, Vector]) -> bool:
+    """Check whether any of the points is an (N, 3) array of points."""
+    return any(
+        isinstance(point, np.ndarray) and point.ndim == 2 for point in points
+    )
+
+
+def _as_points(points: Union[Vertex, Vector]) -> NDArray[np.floating]:
+    """Get a float array of points that broadcasts against (N, 3) arrays."""
+    if _is_vertex(points):
+        return points.coords
+
+    return np.asarray(points, dtype=float)